@@ -72,7 +72,7 @@ async def play(ctx: commands.Context, *, search: str) -> None:
 
     # Set autoplay to True. This can be disabled at anytime...
     vc.autoplay = True
-    track = await spotify.SpotifyTrack.search(search)
+    track = await spotify.SpotifyTrack.search(decoded)
 
     # IF the player is not playing immediately play the song...
     # otherwise put it in the queue...
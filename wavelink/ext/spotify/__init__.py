@@ -25,17 +25,32 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextlib
+import datetime
+import email.utils
+import math
 import enum
+import functools
+import itertools
 import re
 import time
-from typing import Any, List, Optional, Type, TypeVar, Union, TYPE_CHECKING
+from typing import Any, AsyncIterator, List, Optional, Type, TypeVar, Union, TYPE_CHECKING
 
 import aiohttp
+import yarl
 from nextcord.ext import commands
 
 import wavelink
 from wavelink import Node, NodePool
 
+try:
+    import orjson
+except ImportError:
+    import json
+    _loads = json.loads
+else:
+    _loads = orjson.loads
+
 if TYPE_CHECKING:
     from wavelink import Player, Playable
 
@@ -48,16 +63,52 @@ __all__ = ('SpotifySearchType',
 
 
 GRANTURL = 'https://accounts.spotify.com/api/token?grant_type=client_credentials'
-URLREGEX = re.compile(r'(https?://open.)?(spotify)(.com/|:)'
-                      r'(?P<type>album|playlist|track|artist)([/:])'
-                      r'(?P<id>[a-zA-Z0-9]+)(\?si=[a-zA-Z0-9]+)?(&dl_branch=[0-9]+)?')
+URLREGEX = re.compile(r'\A(?:https?://open\.)?spotify(?:\.com/|:)'
+                      r'(?P<type>album|playlist|track|artist)[/:]'
+                      r'(?P<id>[a-zA-Z0-9]+)', re.ASCII)
+# Anything not starting with one of these can never match URLREGEX.
+_SPOTIFY_PREFIXES = ('https://open.spotify.com/', 'http://open.spotify.com/', 'spotify.com/', 'spotify:')
 BASEURL = 'https://api.spotify.com/v1/{entity}s/{identifier}'
 RECURL = 'https://api.spotify.com/v1/recommendations?seed_tracks={tracks}'
+_REC_PREFIX = RECURL.partition('{')[0]
+
+# Maximum amount of requests in flight to Spotify at once, per client.
+MAX_CONCURRENCY = 8
+# Sustained amount of requests per second sent to Spotify, per client.
+RATE_LIMIT = 10
+# Amount of times a rate limited (429) request is retried before giving up.
+MAX_RETRIES = 5
+# Longest single wait in seconds between retries, and the longest total wait before giving up.
+# A Retry-After above MAX_RETRY_DELAY fails the request immediately.
+MAX_RETRY_DELAY = 30
+MAX_RETRY_WAIT = 120
+# Size in bytes of the chunks large responses are read in.
+CHUNK_SIZE = 65536
+# Seconds a SpotifyTrack.search result is reused for, and the maximum amount of results kept.
+SEARCH_CACHE_TTL = 60
+SEARCH_CACHE_SIZE = 1024
 
 
 ST = TypeVar("ST", bound="Playable")
 
 
+def _parse_spotify_url(url: str) -> tuple[str, str] | None:
+    """Parse a Spotify URL or URI into its entity type and ID, or None if it does not match."""
+    if not url.startswith(_SPOTIFY_PREFIXES):
+        return None
+
+    return _match_spotify_url(url)
+
+
+@functools.lru_cache(maxsize=2048)
+def _match_spotify_url(url: str) -> tuple[str, str] | None:
+    match = URLREGEX.match(url)
+    if not match:
+        return None
+
+    return match['type'], match['id']
+
+
 def decode_url(url: str) -> Optional[dict]:
     """Check whether the given URL is a valid Spotify URL and return it's type and ID.
 
@@ -86,16 +137,12 @@ def decode_url(url: str) -> Optional[dict]:
         decoded = spotify.decode_url("https://open.spotify.com/track/6BDLcvvtyJD2vnXRDi1IjQ?si=e2e5bd7aaf3d4a2a")
 
         if decoded and decoded['type'] is spotify.SpotifySearchType.track:
-            track = await spotify.SpotifyTrack.search(query=decoded["id"], type=decoded["type"])
+            track = await spotify.SpotifyTrack.search(query=decoded)
     """
-    match = URLREGEX.match(url)
-    if match:
-        try:
-            type_ = SpotifySearchType[match['type']]
-        except KeyError:
-            type_ = SpotifySearchType.unusable
-
-        return {'type': type_, 'id': match['id']}
+    parsed = _parse_spotify_url(url)
+    if parsed:
+        entity, id_ = parsed
+        return {'type': _TYPE_MAP.get(entity, SpotifySearchType.unusable), 'id': id_}
 
     return None
 
@@ -116,6 +163,13 @@ class SpotifySearchType(enum.Enum):
     unusable = 3
 
 
+_TYPE_MAP: dict[str, SpotifySearchType] = {
+    'album': SpotifySearchType.album,
+    'playlist': SpotifySearchType.playlist,
+    'track': SpotifySearchType.track,
+}
+
+
 class SpotifyAsyncIterator:
 
     def __init__(self, *, query: str, limit: int, type: SpotifySearchType, node: Node):
@@ -124,40 +178,80 @@ class SpotifyAsyncIterator:
         self._type = type
         self._node = node
 
-        self._first = True
         self._count = 0
-        self._queue = asyncio.Queue()
+        self._agen: AsyncIterator[dict[str, Any] | None] | None = None
 
     def __aiter__(self):
         return self
 
-    async def fill_queue(self):
-        tracks = await self._node._spotify._search(query=self._query, iterator=True, type=self._type)
-
-        for track in tracks:
-            await self._queue.put(track)
-
     async def __anext__(self):
-        if self._first:
-            await self.fill_queue()
-            self._first = False
-
         if self._limit is not None and self._count == self._limit:
+            await self.aclose()
             raise StopAsyncIteration
 
-        try:
-            track = self._queue.get_nowait()
-        except asyncio.QueueEmpty as e:
-            raise StopAsyncIteration from e
+        if self._agen is None:
+            self._agen = self._node._spotify._stream(query=self._query, type=self._type)
 
-        if track is None:
-            return await self.__anext__()
+        track = None
+        while track is None:
+            track = await self._agen.__anext__()
 
         track = SpotifyTrack(track)
 
         self._count += 1
         return track
 
+    async def aclose(self) -> None:
+        """Stop the underlying Spotify request stream, cancelling any pending page requests."""
+        if self._agen is not None:
+            await self._agen.aclose()
+
+
+def _retry_after(value: str | None) -> float:
+    """Parse a Retry-After header given either in seconds or as an HTTP-date, falling back to 1 second."""
+    if value is None:
+        return 1
+
+    try:
+        delay = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(delay, 0) if math.isfinite(delay) else 1
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 1
+
+    if date.tzinfo is None:
+        return 1
+
+    return max((date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0)
+
+
+class _TokenBucket:
+    """A simple token bucket allowing ``rate`` acquisitions per second, with bursts of up to ``rate``."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._last = time.monotonic()
+                self._tokens = 1
+
+            self._tokens -= 1
+
 
 class SpotifyRequestError(Exception):
     """Base error for Spotify requests.
@@ -209,8 +303,8 @@ class SpotifyTrack:
     __slots__ = (
         'raw',
         'album',
-        'images',
-        'artists',
+        '_images',
+        '_artists',
         'name',
         'title',
         'uri',
@@ -224,13 +318,10 @@ class SpotifyTrack:
     def __init__(self, data: dict[str, Any]) -> None:
         self.raw: dict[str, Any] = data
 
-        album = data['album']
-        self.album: str = album['name']
-        self.images: list[str] = [i['url'] for i in album['images']]
+        self.album: str = data['album']['name']
 
-        artists = data['artists']
-        self.artists: list[str] = [a['name'] for a in artists]
-        # self.genres: list[str] = [a['genres'] for a in artists]
+        self._images: list[str] | None = None
+        self._artists: list[str] | None = None
 
         self.name: str = data['name']
         self.title: str = self.name
@@ -242,12 +333,37 @@ class SpotifyTrack:
         self.isrc: str | None = data["external_ids"].get("isrc")
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, SpotifyTrack):
+            return NotImplemented
+
         return self.id == other.id
 
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    @property
+    def images(self) -> list[str]:
+        """A list of URLs to images associated with this track."""
+        if self._images is None:
+            self._images = [i['url'] for i in self.raw['album']['images']]
+
+        return self._images
+
+    @property
+    def artists(self) -> list[str]:
+        """A list of artists for this track."""
+        if self._artists is None:
+            self._artists = [a['name'] for a in self.raw['artists']]
+
+        return self._artists
+
     @classmethod
     async def search(
         cls: Type[ST],
-            query: str,
+            query: str | dict,
             *,
             type: SpotifySearchType = SpotifySearchType.track,
             node: Node | None = None,
@@ -259,10 +375,12 @@ class SpotifyTrack:
 
         Parameters
         ----------
-        query: str
-            The song to search for.
+        query: Union[str, dict]
+            The song to search for. This can also be a mapping returned from :func:`decode_url`,
+            in which case the URL is not parsed again.
         type: Optional[:class:`spotify.SpotifySearchType`]
             An optional enum value to use when searching with Spotify. Defaults to track.
+            Overridden by the mapping's type when ``query`` is a mapping from :func:`decode_url`.
         node: Optional[:class:`wavelink.Node`]
             An optional Node to use to make the search with.
         return_first: Optional[bool]
@@ -271,15 +389,29 @@ class SpotifyTrack:
         Returns
         -------
         Union[Optional[Track], List[Track]]
+
+        Raises
+        ------
+        TypeError
+            ``query`` is a mapping from :func:`decode_url` with the unusable type.
         """
         if node is None:
             node: Node = NodePool.get_connected_node()
 
+        if isinstance(query, dict):
+            type = query['type']
+            if type is SpotifySearchType.unusable:
+                raise TypeError("Decoded Spotify URL must be of type track, album or playlist.")
+
+            entity, identifier = type.name, query['id']
+        else:
+            entity, identifier = _parse_spotify_url(query) or (type.name, query)
+
         if type == SpotifySearchType.track:
-            tracks = await node._spotify._search(query=query, type=type)
+            tracks = await node._spotify._cached_search(entity, identifier)
 
             return tracks[0] if return_first else tracks
-        return await node._spotify._search(query=query, type=type)
+        return await node._spotify._cached_search(entity, identifier)
 
     @classmethod
     def iterator(cls,
@@ -343,10 +475,24 @@ class SpotifyTrack:
         cls
             The class to convert this Spotify Track to.
         """
-        try:
-            tracks: list[cls] = await cls.search(f'"{self.isrc}"')
-        except wavelink.NoTracksError:
-            tracks: list[cls] = await cls.search(f'{self.name} - {self.artists[0]}')
+        fallback: str = f'{self.name} - {self.artists[0]}'
+
+        if self.isrc is None:
+            tracks: list[cls] = await cls.search(fallback)
+        else:
+            # Search by name alongside the ISRC so a failed ISRC search doesn't cost a second round trip.
+            fallback_task = asyncio.create_task(cls.search(fallback))
+
+            try:
+                tracks: list[cls] = await cls.search(f'"{self.isrc}"')
+            except wavelink.NoTracksError:
+                tracks: list[cls] = await fallback_task
+            finally:
+                if not fallback_task.done():
+                    fallback_task.cancel()
+                elif not fallback_task.cancelled():
+                    # Mark an unused failure as retrieved so asyncio doesn't log it.
+                    fallback_task.exception()
 
         if not player.autoplay or not populate:
             return tracks[0]
@@ -357,24 +503,20 @@ class SpotifyTrack:
         if not sc:
             raise RuntimeError(f"There is no spotify client associated with <{node:!r}>")
 
-        if len(player._track_seeds) == 5:
-            player._track_seeds.pop(0)
-
         player._track_seeds.append(self.id)
 
-        url: str = RECURL.format(tracks=','.join(player._track_seeds))
-        async with node._session.get(url=url, headers=sc.bearer_headers) as resp:
-            if resp.status != 200:
-                raise SpotifyRequestError(resp.status, resp.reason)
-
-            data = await resp.json()
+        url: str = _REC_PREFIX + ','.join(player._track_seeds)
+        data = await sc._request('GET', url, headers=sc.bearer_headers)
 
-        recos = [SpotifyTrack(t) for t in data['tracks']]
-        for reco in recos:
-            if reco in player.auto_queue or reco in player.auto_queue.history:
-                pass
+        existing: set[str] = {
+            t.id for t in itertools.chain(player.auto_queue, player.auto_queue.history)
+            if isinstance(t, SpotifyTrack)
+        }
 
-            await player.auto_queue.put_wait(reco)
+        recos = [SpotifyTrack(t) for t in data['tracks'] if t['id'] not in existing]
+        if recos:
+            player.auto_queue.extend(recos)
+            await asyncio.sleep(0)
 
         return tracks[0]
 
@@ -388,106 +530,257 @@ class SpotifyClient:
         Your spotify application client ID.
     client_secret: str
         Your spotify application secret.
+    session: Optional[aiohttp.ClientSession]
+        An optional session to use for requests to Spotify.
+        If not provided, a session with a keep-alive connection pool is created.
     """
 
-    def __init__(self, *, client_id: str, client_secret: str):
+    def __init__(self, *, client_id: str, client_secret: str, session: aiohttp.ClientSession | None = None):
         self._client_id = client_id
         self._client_secret = client_secret
 
-        self.session = aiohttp.ClientSession()
+        self._owns_session: bool = session is None
+        self.session = session or aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=75)
+        )
+
+        authbytes = f'{self._client_id}:{self._client_secret}'.encode()
+        self._grant_headers: dict[str, str] = {'Authorization': f'Basic {base64.b64encode(authbytes).decode()}',
+                                               'Content-Type': 'application/x-www-form-urlencoded'}
+
+        self._limiter = asyncio.Semaphore(MAX_CONCURRENCY)
+        self._bucket = _TokenBucket(RATE_LIMIT)
+
+        self._token_lock = asyncio.Lock()
+
+        self._search_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+        # Maps a search to its lock and the amount of tasks currently using it.
+        self._search_locks: dict[tuple[str, str], list[asyncio.Lock | int]] = {}
 
         self._bearer_token: str = None  # type: ignore
+        self._bearer_headers: dict[str, str] = {}
         self._expiry: int = 0
 
     @property
     def grant_headers(self) -> dict:
-        authbytes = f'{self._client_id}:{self._client_secret}'.encode()
-        return {'Authorization': f'Basic {base64.b64encode(authbytes).decode()}',
-                'Content-Type': 'application/x-www-form-urlencoded'}
+        return self._grant_headers
 
     @property
     def bearer_headers(self) -> dict:
-        return {'Authorization': f'Bearer {self._bearer_token}'}
+        return self._bearer_headers
 
     async def _get_bearer_token(self) -> None:
-        async with self.session.post(GRANTURL, headers=self.grant_headers) as resp:
-            if resp.status != 200:
-                raise SpotifyRequestError(resp.status, resp.reason)
+        data = await self._request('POST', GRANTURL, headers=self.grant_headers)
 
-            data = await resp.json()
-            self._bearer_token = data['access_token']
-            self._expiry = time.time() + (int(data['expires_in']) - 10)
+        self._bearer_token = data['access_token']
+        self._bearer_headers = {'Authorization': f'Bearer {self._bearer_token}'}
+        self._expiry = time.time() + (int(data['expires_in']) - 10)
 
-    async def _search(self,
-                      query: str,
-                      type: SpotifySearchType = SpotifySearchType.track,
-                      iterator: bool = False,
-                      ) -> SpotifyTrack | list[SpotifyTrack]:
+    async def close(self) -> None:
+        """|coro|
+
+        Close the session used for requests to Spotify.
+
+        A session passed in when creating this client is left open.
+        """
+        if self._owns_session:
+            await self.session.close()
+
+    async def _request(self,
+                       method: str,
+                       url: str | yarl.URL,
+                       *,
+                       chunked: bool = False,
+                       **kwargs: Any,
+                       ) -> dict[str, Any]:
+        """Make a rate limited request to Spotify, retrying with backoff when Spotify responds with 429.
+
+        When chunked is True the body is read incrementally into a single buffer, which suits large pages.
+        """
+        waited = 0.0
 
+        for attempt in range(MAX_RETRIES + 1):
+            async with self._limiter:
+                await self._bucket.acquire()
+
+                async with self.session.request(method, url, **kwargs) as resp:
+                    if resp.status == 200 and chunked:
+                        buffer = bytearray()
+                        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                            buffer += chunk
+
+                        return _loads(buffer)
+
+                    if resp.status == 200:
+                        return await resp.json(loads=_loads)
+
+                    if resp.status != 429 or attempt == MAX_RETRIES:
+                        raise SpotifyRequestError(resp.status, resp.reason)
+
+                    retry_after = _retry_after(resp.headers.get('Retry-After'))
+                    delay = min(retry_after * 2 ** attempt, MAX_RETRY_DELAY)
+
+                    if retry_after > MAX_RETRY_DELAY or waited + delay > MAX_RETRY_WAIT:
+                        raise SpotifyRequestError(resp.status, resp.reason)
+
+            waited += delay
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _page_urls(first: dict[str, Any]) -> list[yarl.URL]:
+        """Build the URLs of every page after the first of a paginated Spotify object."""
+        total: int = first['total']
+        limit: int = first['limit']
+        href = yarl.URL(first['href'])
+
+        return [href.update_query(offset=offset, limit=limit) for offset in range(limit, total, limit)]
+
+    async def _stream_pages(self, first: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Yield every page after the first of a paginated Spotify object, in order, as soon as it arrives.
+
+        All pages are requested up front so later pages download while earlier ones are consumed.
+        """
+        tasks = [asyncio.create_task(self._request('GET', url, chunked=True, headers=self.bearer_headers))
+                 for url in self._page_urls(first)]
+
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            # Retrieve the outcome of every task so failed pages aren't logged as never retrieved.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _stream_album(self, data: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        # Every track shares the album payload itself, minus its tracks.
+        album_tracks = data.pop('tracks')
+
+        for track in album_tracks['items']:
+            track['album'] = data
+            yield track
+
+        if not album_tracks['next']:
+            return
+
+        async with contextlib.aclosing(self._stream_pages(album_tracks)) as pages:
+            async for page in pages:
+                for track in page['items']:
+                    track['album'] = data
+                    yield track
+
+    async def _stream_playlist(self, data: dict[str, Any]) -> AsyncIterator[dict[str, Any] | None]:
+        for item in data['tracks']['items']:
+            yield item['track']
+
+        if not data['tracks']['next']:
+            return
+
+        async with contextlib.aclosing(self._stream_pages(data['tracks'])) as pages:
+            async for page in pages:
+                for item in page['items']:
+                    yield item['track']
+
+    def _stream(self, query: str, type: SpotifySearchType) -> AsyncIterator[dict[str, Any] | None]:
+        entity, identifier = _parse_spotify_url(query) or (type.name, query)
+        return self._stream_parsed(entity=entity, identifier=identifier)
+
+    async def _stream_parsed(self, *, entity: str, identifier: str) -> AsyncIterator[dict[str, Any] | None]:
+        """Yield the raw track payloads of an album or playlist while the remaining pages are fetched."""
+        data = await self._get_entity(entity, identifier)
+
+        async with contextlib.aclosing(self._stream_entity(data)) as tracks:
+            async for track in tracks:
+                yield track
+
+    def _stream_entity(self, data: dict[str, Any]) -> AsyncIterator[dict[str, Any] | None]:
+        if data['type'] == 'album':
+            return self._stream_album(data)
+        elif data['type'] == 'playlist':
+            return self._stream_playlist(data)
+
+        raise TypeError("Iterator search type must be either album or playlist.")
+
+    async def _get_entity(self, entity: str, identifier: str) -> dict[str, Any]:
         if not self._bearer_token or time.time() >= self._expiry:
-            await self._get_bearer_token()
+            async with self._token_lock:
+                # Another task may have refreshed the token while this one waited on the lock.
+                if not self._bearer_token or time.time() >= self._expiry:
+                    await self._get_bearer_token()
 
-        regex_result = URLREGEX.match(query)
+        url = BASEURL.format(entity=entity, identifier=identifier)
+        return await self._request('GET', url, headers=self.bearer_headers)
 
-        url = (
-            BASEURL.format(
-                entity=regex_result['type'], identifier=regex_result['id']
-            )
-            if regex_result
-            else BASEURL.format(entity=type.name, identifier=query)
-        )
-        async with self.session.get(url, headers=self.bearer_headers) as resp:
-            if resp.status != 200:
-                raise SpotifyRequestError(resp.status, resp.reason)
+    async def _cached_search(self, entity: str, identifier: str) -> Any:
+        """Search by entity type and ID, reusing results of identical searches made in the last minute.
 
-            data = await resp.json()
+        Concurrent identical searches wait on each other so only one request is made.
+        """
+        key = (entity, identifier)
 
-        if data['type'] == 'track':
-            return SpotifyTrack(data)
-
-        elif data['type'] == 'album':
-            album_data: dict[str, Any]= {
-                                        'album_type': data['album_type'],
-                                        'artists': data['artists'],
-                                        'available_markets': data['available_markets'],
-                                        'external_urls': data['external_urls'],
-                                        'href': data['href'],
-                                        'id': data['id'],
-                                        'images': data['images'],
-                                        'name': data['name'],
-                                        'release_date': data['release_date'],
-                                        'release_date_precision': data['release_date_precision'],
-                                        'total_tracks': data['total_tracks'],
-                                        'type': data['type'],
-                                        'uri': data['uri'],
-                                        }
-            tracks = []
-            for track in data['tracks']['items']:
-                track['album'] = album_data
-                if iterator:
-                    tracks.append(track)
+        entry = self._search_locks.get(key)
+        if entry is None:
+            entry = self._search_locks[key] = [asyncio.Lock(), 0]
+
+        lock: asyncio.Lock = entry[0]
+        entry[1] += 1
+
+        try:
+            async with lock:
+                cached = self._search_cache.get(key)
+
+                if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+                    raw = cached[1]
                 else:
-                    tracks.append(SpotifyTrack(track))
+                    raw = await self._search_raw(entity=entity, identifier=identifier)
 
-            return tracks
+                    if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                        self._search_cache.clear()
 
-        elif data['type'] == 'playlist':
-            if iterator:
-                if not data['tracks']['next']:
-                    return [t['track'] for t in data['tracks']['items']]
+                    self._search_cache[key] = (time.monotonic(), raw)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._search_locks[key]
+
+        # Only raw payloads are cached, so every caller gets its own tracks to set attributes on.
+        return self._build_tracks(raw)
+
+    async def _search(self,
+                      query: str,
+                      type: SpotifySearchType = SpotifySearchType.track,
+                      iterator: bool = False,
+                      ) -> SpotifyTrack | list[SpotifyTrack]:
+        entity, identifier = _parse_spotify_url(query) or (type.name, query)
+        return await self._search_parsed(entity=entity, identifier=identifier, iterator=iterator)
+
+    async def _search_parsed(self,
+                             *,
+                             entity: str,
+                             identifier: str,
+                             iterator: bool = False,
+                             ) -> SpotifyTrack | list[SpotifyTrack]:
+        if iterator:
+            async with contextlib.aclosing(self._stream_parsed(entity=entity, identifier=identifier)) as tracks:
+                return [track async for track in tracks]
 
-                url = data['tracks']['next']
+        return self._build_tracks(await self._search_raw(entity=entity, identifier=identifier))
+
+    async def _search_raw(self, *, entity: str, identifier: str) -> dict[str, Any] | list[dict[str, Any]]:
+        """Return the raw payload of a track, or the raw track payloads of an album or playlist."""
+        data = await self._get_entity(entity, identifier)
+
+        if data['type'] == 'track':
+            return data
 
-                items = [t['track'] for t in data['tracks']['items']]
-                while True:
-                    async with self.session.get(url, headers=self.bearer_headers) as resp:
-                        data = await resp.json()
+        # Albums and playlists are collected from every page, fetched concurrently.
+        async with contextlib.aclosing(self._stream_entity(data)) as tracks:
+            return [track async for track in tracks if track is not None]
 
-                        items.extend([t['track'] for t in data['items']])
-                        if not data['next']:
-                            return items
+    @staticmethod
+    def _build_tracks(raw: dict[str, Any] | list[dict[str, Any]]) -> SpotifyTrack | list[SpotifyTrack]:
+        if isinstance(raw, dict):
+            return SpotifyTrack(raw)
 
-                        url = data['next']
-            else:
-                tracks = data['tracks']['items']
-                return [SpotifyTrack(t) for t in tracks]
+        return [SpotifyTrack(track) for track in raw]
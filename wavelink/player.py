@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import datetime
 import logging
+from collections import deque
 from typing import TYPE_CHECKING, Any, Union
 
 import nextcord
@@ -151,7 +152,7 @@ class Player(nextcord.VoiceProtocol):
         self._volume: int = 50
         self._paused: bool = False
 
-        self._track_seeds: list[str] = []
+        self._track_seeds: deque[str] = deque(maxlen=5)
         self._autoplay: bool = False
         self.auto_queue: Queue = Queue()
         self._auto_threshold: int = 20